@@ -1,26 +1,66 @@
 #!/usr/bin/env python3
 """
-Flask Web Application for OCR Testing
+Quart Web Application for OCR Testing
 Provides a web interface to test OCR functionality with JSON output.
 """
 
 import os
 import json
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify
-from werkzeug.utils import secure_filename
+
+import aiofiles.tempfile
+import orjson
+from quart import Quart, Response, abort, render_template, request, jsonify
+from quart.json.provider import JSONProvider
 from dotenv import load_dotenv
 from ocr_app import OCRApp
 
+# Optional BLAKE3 for hashing uploads (falls back to hashlib's BLAKE2b)
+try:
+    from blake3 import blake3 as content_hasher
+except ImportError:
+    from hashlib import blake2b as content_hasher
+
 # Load environment variables from .env file
 load_dotenv()
 
-app = Flask(__name__)
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which is much faster than stdlib json for large OCR results."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Use orjson's bytes output as the body directly, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration from environment variables
 MAX_FILE_SIZE_MB = int(os.getenv('MAX_FILE_SIZE_MB', '16'))
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE_MB * 1024 * 1024
 app.config['UPLOAD_FOLDER'] = os.getenv('UPLOAD_FOLDER', 'uploads')
+MAX_CONCURRENCY = int(os.getenv('MAX_CONCURRENCY', '8'))
+OCR_RPS = float(os.getenv('OCR_RPS', '4'))
+
+# Write streamed uploads in large chunks
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Seconds between keep-alive comments on idle OCR event streams
+SSE_HEARTBEAT_INTERVAL = 15
+
+# Memory budget in MB for OCR results kept for repeated uploads, per worker process, 0 to disable
+OCR_CACHE_MB = float(os.getenv('OCR_CACHE_MB', '32'))
+OCR_CACHE_MAX_BYTES = int(OCR_CACHE_MB * 1024 * 1024)
 
 # Ensure upload folder exists
 Path(app.config['UPLOAD_FOLDER']).mkdir(exist_ok=True)
@@ -44,6 +84,13 @@ MODELS = {
     }
 }
 
+# OCR app instances per model_id, see get_ocr_app()
+ocr_apps = {}
+
+# (page results, size in bytes) per (content hash, model_id, prompt, dpi), least recently used first
+ocr_cache = OrderedDict()
+ocr_cache_bytes = 0
+
 # Validate configurations at startup
 print("=" * 60)
 print("Available Models:")
@@ -55,15 +102,15 @@ for model_id, config in MODELS.items():
 print("=" * 60)
 
 
-def allowed_file(filename):
-    """Check if file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+def file_extension(filename):
+    """Return the lowercased file extension, or '' if there is none."""
+    return filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
 
 
 @app.route('/')
-def index():
+async def index():
     """Render main page."""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 
 @app.route('/health')
@@ -72,103 +119,163 @@ def health():
     return jsonify({'status': 'healthy'}), 200
 
 
-@app.route('/api/ocr', methods=['POST'])
-def ocr():
+def check_model(model_id):
     """
-    OCR endpoint for processing uploaded files.
+    Validate that the requested model exists and is configured.
 
-    Returns JSON response with OCR results.
+    Returns an error response, or None if the model can be used.
     """
-    # Check if file was uploaded
-    if 'file' not in request.files:
-        return jsonify({'error': 'No file uploaded'}), 400
-
-    file = request.files['file']
-
-    if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
-
-    if not allowed_file(file.filename):
-        return jsonify({'error': f'File type not allowed. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}'}), 400
-
-    # Get selected model
-    model_id = request.form.get('model_id', 'qwen2-vl-32b')
-
     if model_id not in MODELS:
         return jsonify({
             'success': False,
             'error': f'Invalid model_id: {model_id}. Available models: {", ".join(MODELS.keys())}'
         }), 400
 
-    # Get model configuration
-    model_config = MODELS[model_id]
-
     # Check if model is configured
+    model_config = MODELS[model_id]
     if not model_config['api_key']:
         return jsonify({
             'success': False,
             'error': f'Model {model_config["name"]} is not configured. Missing API key.'
         }), 500
 
-    try:
-        # Save uploaded file with proper extension
-        original_filename = file.filename
-        filename = secure_filename(original_filename)
-
-        # Ensure extension is preserved
-        if not filename or '.' not in filename:
-            # If secure_filename removed extension, restore it
-            ext = original_filename.rsplit('.', 1)[1].lower() if '.' in original_filename else ''
-            if ext:
-                filename = f"{filename or 'file'}.{ext}"
-
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-
-        print(f"File saved: {filepath}")
-        print(f"Original filename: {original_filename}")
-        print(f"Secured filename: {filename}")
-        print(f"Using model: {model_config['name']}")
+    return None
 
-        # Get custom prompt if provided
-        prompt = request.form.get('prompt', 'OCR this image and extract all text.')
-        dpi = int(request.form.get('dpi', 200))
 
-        # Initialize OCR app with selected model
-        ocr_app = OCRApp(
+def get_ocr_app(model_id):
+    """
+    Return the OCR app for a model, creating it on first use.
+
+    Instances are cached so their HTTP connection pools are reused across requests.
+    """
+    if model_id not in ocr_apps:
+        model_config = MODELS[model_id]
+        ocr_apps[model_id] = OCRApp(
             model_config['api_url'],
             model_config['api_key'],
-            model_config['model']
+            model_config['model'],
+            max_concurrency=MAX_CONCURRENCY,
+            rps=OCR_RPS
         )
+    return ocr_apps[model_id]
+
 
-        # Determine file type from extension
-        file_ext = filename.lower().rsplit('.', 1)[1] if '.' in filename else ''
+def content_hash(data):
+    """Return the hex digest identifying uploaded file contents."""
+    return content_hasher(data).hexdigest()
+
+
+def cache_get(key):
+    """Return cached page results for a key, or None."""
+    entry = ocr_cache.get(key)
+    if entry is None:
+        return None
+    ocr_cache.move_to_end(key)
+    return entry[0]
+
+
+def cache_put(key, results):
+    """
+    Cache page results unless any page failed, evicting the oldest entries.
+
+    Entries are sized by their serialized JSON, so a long PDF counts for its
+    full result rather than as one entry. Results larger than the whole
+    budget are not cached.
+    """
+    global ocr_cache_bytes
+
+    if OCR_CACHE_MAX_BYTES <= 0 or any('error' in result['response'] for result in results):
+        return
+
+    size = len(orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS))
+    if size > OCR_CACHE_MAX_BYTES:
+        return
+
+    if key in ocr_cache:
+        ocr_cache_bytes -= ocr_cache.pop(key)[1]
+    ocr_cache[key] = (results, size)
+    ocr_cache_bytes += size
+    while ocr_cache_bytes > OCR_CACHE_MAX_BYTES:
+        _, (_, evicted) = ocr_cache.popitem(last=False)
+        ocr_cache_bytes -= evicted
+
+
+@app.after_serving
+async def close_ocr_apps():
+    """Close pooled HTTP sessions on shutdown."""
+    for ocr_app in ocr_apps.values():
+        await ocr_app.aclose()
+
+
+def parse_options(options):
+    """
+    Read the OCR prompt and DPI from form fields or query parameters.
+
+    Returns a tuple of (error response or None, (prompt, dpi)).
+    """
+    prompt = options.get('prompt', 'OCR this image and extract all text.')
+    try:
+        dpi = int(options.get('dpi', 200))
+    except ValueError:
+        dpi = 0
+    if dpi <= 0:
+        return (jsonify({'success': False, 'error': f'Invalid dpi: {options.get("dpi")}'}), 400), None
+
+    return None, (prompt, dpi)
+
+
+async def run_ocr(source, filename, file_ext, model_id, prompt, dpi, digest=None):
+    """
+    Run OCR on an uploaded file.
+
+    Args:
+        source: Raw file bytes, or path of a saved upload
+        filename: File name reported back to the client
+        file_ext: Validated file extension
+        model_id: Validated model identifier
+        prompt: OCR prompt, see parse_options()
+        dpi: PDF rendering resolution, see parse_options()
+        digest: Content hash of the file, computed from source if it is bytes
+
+    Returns JSON response with OCR results.
+    """
+    model_config = MODELS[model_id]
+
+    try:
+        print(f"Using model: {model_config['name']}")
+
+        # Identical uploads with the same settings reuse earlier results
+        if digest is None and isinstance(source, bytes):
+            digest = content_hash(source)
+        key = (digest, model_id, prompt, dpi) if digest else None
+        results = cache_get(key) if key else None
+        cached = results is not None
 
         # Process file
-        if file_ext == 'pdf':
+        if cached:
+            print(f"Cache hit: {filename}")
+        elif file_ext == 'pdf':
             # Process PDF
-            print(f"Processing as PDF: {filepath}")
-            results = ocr_app.process_pdf(filepath, prompt, dpi)
-            response_data = {
-                'success': True,
-                'filename': filename,
-                'type': 'pdf',
-                'pages': len(results),
-                'results': results
-            }
+            print(f"Processing as PDF: {filename}")
+            results = await get_ocr_app(model_id).process_pdf_async(source, prompt, dpi)
         else:
             # Process single image
-            print(f"Processing as image: {filepath}")
-            result = ocr_app.ocr_image(filepath, prompt)
-            response_data = {
-                'success': True,
-                'filename': filename,
-                'type': 'image',
-                'results': [{'page': 1, 'response': result}]
-            }
-
-        # Clean up uploaded file
-        os.remove(filepath)
+            print(f"Processing as image: {filename}")
+            result = await get_ocr_app(model_id).ocr_image_async(source, prompt)
+            results = [{'page': 1, 'response': result}]
+
+        if key and not cached:
+            cache_put(key, results)
+
+        response_data = {
+            'success': True,
+            'filename': filename,
+            'type': 'pdf' if file_ext == 'pdf' else 'image'
+        }
+        if file_ext == 'pdf':
+            response_data['pages'] = len(results)
+        response_data['results'] = results
+        response_data['cached'] = cached
 
         return jsonify(response_data)
 
@@ -179,10 +286,6 @@ def ocr():
         print(f"ERROR in OCR processing:")
         print(error_trace)
 
-        # Clean up file if it exists
-        if 'filepath' in locals() and os.path.exists(filepath):
-            os.remove(filepath)
-
         return jsonify({
             'success': False,
             'error': str(e),
@@ -190,6 +293,222 @@ def ocr():
         }), 500
 
 
+async def read_upload():
+    """
+    Read and validate a multipart upload with 'file' and optional 'model_id' fields.
+
+    Returns a tuple of (error response or None, (data, filename, file_ext, model_id, form)).
+    """
+    files = await request.files
+    form = await request.form
+
+    # Check if file was uploaded
+    if 'file' not in files:
+        return (jsonify({'error': 'No file uploaded'}), 400), None
+
+    file = files['file']
+
+    if file.filename == '':
+        return (jsonify({'error': 'No file selected'}), 400), None
+
+    ext = file_extension(file.filename)
+    if ext not in ALLOWED_EXTENSIONS:
+        return (jsonify({'error': f'File type not allowed. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}'}), 400), None
+
+    # Get selected model
+    model_id = form.get('model_id', 'qwen2-vl-32b')
+    error = check_model(model_id)
+    if error:
+        return error, None
+
+    # Keep the upload in memory (bounded by MAX_CONTENT_LENGTH), no disk round-trip
+    data = file.read()
+
+    # The upload never touches disk, so the client's filename is only echoed back
+    print(f"File received: {file.filename} ({len(data)} bytes)")
+
+    return None, (data, file.filename, ext, model_id, form)
+
+
+@app.route('/api/ocr', methods=['POST'])
+async def ocr():
+    """
+    OCR endpoint for processing uploaded files.
+
+    Returns JSON response with OCR results.
+    """
+    error, upload = await read_upload()
+    if error:
+        return error
+
+    data, filename, ext, model_id, form = upload
+    error, options = parse_options(form)
+    if error:
+        return error
+
+    return await run_ocr(data, filename, ext, model_id, *options)
+
+
+def sse_event(data, event=None):
+    """Format a Server-Sent Events message with a JSON payload."""
+    message = b'data: ' + orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b'\n\n'
+    return f'event: {event}\n'.encode('utf-8') + message if event else message
+
+
+async def stream_ocr(source, filename, file_ext, model_id, prompt, dpi):
+    """
+    Run OCR on an uploaded file and yield Server-Sent Events as pages complete.
+
+    Emits one message per page, a comment every SSE_HEARTBEAT_INTERVAL seconds
+    while waiting, and a final 'done' (or 'error') event. The caller validates
+    prompt and dpi, since the 200 status is already sent when this runs.
+    """
+    ocr_app = get_ocr_app(model_id)
+    key = (content_hash(source), model_id, prompt, dpi)
+    cached = cache_get(key)
+
+    async def single_image():
+        yield {'page': 1, 'response': await ocr_app.ocr_image_async(source, prompt)}
+
+    async def cached_pages():
+        for result in cached:
+            yield result
+
+    if cached is not None:
+        print(f"Cache hit: {filename}")
+        results = cached_pages()
+    elif file_ext == 'pdf':
+        print(f"Streaming PDF: {filename}")
+        results = ocr_app.iter_pdf_results(source, prompt, dpi)
+    else:
+        print(f"Streaming image: {filename}")
+        results = single_image()
+
+    completed = []
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(results.__anext__())
+
+            # Wait without cancelling, so a slow page is not lost to the heartbeat
+            finished, _ = await asyncio.wait({pending}, timeout=SSE_HEARTBEAT_INTERVAL)
+            if not finished:
+                yield b': heartbeat\n\n'
+                continue
+
+            try:
+                result = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                break
+            pending = None
+
+            completed.append(result)
+            yield sse_event(result)
+
+        if cached is None:
+            cache_put(key, sorted(completed, key=lambda result: result['page']))
+
+        yield sse_event({'pages': len(completed)}, event='done')
+
+    except Exception as e:
+        import traceback
+        error_trace = traceback.format_exc()
+        print("ERROR in OCR streaming:")
+        print(error_trace)
+
+        yield sse_event({'error': str(e), 'traceback': error_trace if app.debug else None}, event='error')
+
+    finally:
+        # Client went away mid-stream: stop the OCR work behind it
+        if pending is not None:
+            pending.cancel()
+        else:
+            await results.aclose()
+
+
+@app.route('/api/ocr/stream', methods=['POST'])
+async def ocr_stream():
+    """
+    OCR endpoint that streams per-page results as Server-Sent Events.
+
+    Takes the same multipart form as /api/ocr. Each completed page is sent as
+    'data: {"page": k, "response": ...}', followed by 'event: done' with the page count.
+    """
+    error, upload = await read_upload()
+    if error:
+        return error
+
+    data, filename, ext, model_id, form = upload
+
+    # Validate options before the 200 headers go out with the stream
+    error, options = parse_options(form)
+    if error:
+        return error
+
+    response = Response(stream_ocr(data, filename, ext, model_id, *options), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop nginx-style proxies from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    # Large PDFs can stream for longer than RESPONSE_TIMEOUT
+    response.timeout = None
+    return response
+
+
+@app.route('/api/ocr/<ext>', methods=['POST'])
+async def ocr_raw(ext):
+    """
+    OCR endpoint for raw file uploads (e.g. Content-Type: application/pdf).
+
+    The request body is streamed straight to disk without multipart parsing.
+    Options are passed as query parameters: model_id, prompt, dpi.
+
+    Returns JSON response with OCR results.
+    """
+    ext = ext.lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        return jsonify({'error': f'File type not allowed. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}'}), 400
+
+    # Get selected model
+    model_id = request.args.get('model_id', 'qwen2-vl-32b')
+    error = check_model(model_id)
+    if error:
+        return error
+
+    error, options = parse_options(request.args)
+    if error:
+        return error
+
+    # Temporary file names are generated, so they are always safe. The file is
+    # removed when the context exits, whether OCR succeeded or not.
+    async with aiofiles.tempfile.NamedTemporaryFile(
+        dir=app.config['UPLOAD_FOLDER'], suffix=f'.{ext}', delete=True
+    ) as tmp:
+        # Coalesce small ASGI body chunks into large writes, hashing as they arrive
+        hasher = content_hasher()
+        buffer = bytearray()
+        size = 0
+        async for chunk in request.body:
+            # Quart only checks MAX_CONTENT_LENGTH up front against Content-Length,
+            # so chunked uploads have to be limited here
+            size += len(chunk)
+            if size > app.config['MAX_CONTENT_LENGTH']:
+                abort(413)
+            hasher.update(chunk)
+            buffer += chunk
+            if len(buffer) >= UPLOAD_BUFFER_SIZE:
+                await tmp.write(buffer)
+                buffer.clear()
+        await tmp.write(buffer)
+        await tmp.flush()
+
+        print(f"File saved: {tmp.name}")
+
+        return await run_ocr(tmp.name, os.path.basename(tmp.name), ext, model_id, *options,
+                             digest=hasher.hexdigest())
+
+
 @app.route('/api/config', methods=['GET'])
 def config():
     """Get current API configuration and available models."""
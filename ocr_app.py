@@ -5,16 +5,27 @@ Supports local/remote images, multi-page documents, and PDF files.
 """
 
 import argparse
+import asyncio
 import base64
 import io
 import json
 import os
+import random
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union, AsyncIterator, Tuple
 
+import aiohttp
+import orjson
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -26,16 +37,204 @@ try:
     PDF_BACKEND = 'pypdfium2'
 except ImportError:
     try:
-        from pdf2image import convert_from_path
+        from pdf2image import convert_from_bytes, convert_from_path
         PDF_BACKEND = 'pdf2image'
     except ImportError:
         PDF_BACKEND = None
 
+# Optional libjpeg-turbo JPEG encoder (falls back to Pillow's encoder).
+# The handle is created once since loading the native library is not free.
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    TURBOJPEG = TurboJPEG()
+    JPEG_BACKEND = 'turbojpeg'
+except (ImportError, OSError, RuntimeError):
+    # RuntimeError: PyTurboJPEG is installed but libturbojpeg is missing
+    TURBOJPEG = None
+    JPEG_BACKEND = 'pillow'
+
+# Upstream responses worth retrying (rate limiting and transient server errors)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+NON_RETRY_STATUS_CODES = {400, 401, 403}
+
+# Images sent to the API are capped at this many pixels per side to reduce token usage
+MAX_IMAGE_SIZE = 1024
+
+# Worker processes used to render PDF pages in parallel
+DEFAULT_RENDER_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Documents with fewer pages render in-process. Starting a render pool costs
+# ~40-80 ms while a page at MAX_IMAGE_SIZE renders in ~2-60 ms depending on
+# content, so a pool only pays off once there are enough pages to spread out.
+RENDER_POOL_MIN_PAGES = 8
+
+# PDF document opened once per render worker process
+_render_pdf = None
+
+# PDFium is not thread-safe. Every in-process PDFium call (open, len, render,
+# close) holds this lock, and the async path runs them all on one dedicated
+# thread so the event loop itself never waits for the lock.
+_PDFIUM_LOCK = threading.Lock()
+_PDFIUM_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdfium')
+
+# Maximum number of heavy image decodes/renders running at once in this process,
+# so concurrent uploads cannot allocate bitmaps without bound. All async paths
+# (image uploads and PDF pages) share one budget, see _get_decode_semaphore();
+# _DECODE_SEM applies the same limit to the sync entry points.
+DECODE_CONCURRENCY = int(os.getenv('OCR_DECODE_CONCURRENCY', str(max(1, (os.cpu_count() or 2) // 2))))
+_DECODE_SEM = threading.BoundedSemaphore(DECODE_CONCURRENCY)
+
+# Async counterpart of _DECODE_SEM for the running event loop, see _get_decode_semaphore()
+_decode_sem_async = None
+_decode_sem_loop = None
+
+# Worker processes that JPEG/base64-encode PDF pages for the async path, see _get_encode_pool().
+# Defaults to the CPUs this process may run on (os.cpu_count() counts every host CPU,
+# even inside a container pinned to a few). With a single worker there is nothing to
+# parallelize and pages are encoded in a thread.
+_AVAILABLE_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+ENCODE_WORKERS = int(os.getenv('OCR_ENCODE_WORKERS', str(_AVAILABLE_CPUS)))
+_ENCODE_POOL = None
+
+# Pages smaller than this (raw bitmap bytes) are encoded in a thread instead,
+# since shipping them to a worker process costs more than it saves
+ENCODE_POOL_MIN_BYTES = 200 * 1024
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for async API calls."""
+
+    def __init__(self, rps: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rps: Sustained requests per second, also used as the burst size
+        """
+        self.rps = rps
+        self.tokens = rps
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available if the bucket is empty."""
+        now = time.monotonic()
+        self.tokens = min(self.rps, self.tokens + (now - self.updated) * self.rps)
+        self.updated = now
+
+        # Reserve the token up front (the balance may go negative) so concurrent
+        # callers queue behind each other without needing a lock
+        self.tokens -= 1
+        if self.tokens < 0:
+            try:
+                await asyncio.sleep(-self.tokens / self.rps)
+            except asyncio.CancelledError:
+                # Give the reservation back so later callers do not wait for it
+                self.tokens += 1
+                raise
+
+
+def _data_url(buffer: io.BytesIO, mime_type: str) -> str:
+    """Build a base64 data URL straight from an encoded image buffer."""
+    # Encode from a view of the buffer and decode to str once, avoiding the
+    # getvalue() copy and the extra f-string copy of a multi-MB string
+    prefix = f"data:{mime_type};base64,".encode('ascii')
+    return (prefix + base64.b64encode(buffer.getbuffer())).decode('ascii')
+
+
+def _get_encode_pool() -> ProcessPoolExecutor:
+    """Return the shared encode worker pool, creating it on first use."""
+    global _ENCODE_POOL
+    if _ENCODE_POOL is None:
+        _ENCODE_POOL = ProcessPoolExecutor(max_workers=ENCODE_WORKERS)
+    return _ENCODE_POOL
+
+
+def _discard_encode_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken encode pool so the next _get_encode_pool() call starts a fresh one."""
+    global _ENCODE_POOL
+    if _ENCODE_POOL is pool:
+        _ENCODE_POOL = None
+    pool.shutdown(wait=False)
+
+
+def _encode_page(raw: bytes, width: int, height: int, mode: str) -> str:
+    """Encode a raw page bitmap as a JPEG data URL in an encode worker process."""
+    image = OCRApp.resize_image_if_needed(Image.frombytes(mode, (width, height), raw))
+    buffered = io.BytesIO()
+    OCRApp.save_jpeg(image, buffered)
+    return _data_url(buffered, 'image/jpeg')
+
+
+def _pdfium_call(fn, *args):
+    """Call fn while holding the PDFium lock."""
+    with _PDFIUM_LOCK:
+        return fn(*args)
+
+
+def _open_pdf(pdf_path: Union[str, bytes]):
+    """Open a PDF document, returning it with its page count (call under the PDFium lock)."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    return pdf, len(pdf)
+
+
+def _init_render_worker(pdf_path: Union[str, bytes]) -> None:
+    """Open the PDF in a render worker process."""
+    global _render_pdf
+    _render_pdf = pdfium.PdfDocument(pdf_path)
+
+
+def _get_decode_semaphore() -> asyncio.Semaphore:
+    """Return the async decode semaphore, recreated if it is bound to another loop."""
+    global _decode_sem_async, _decode_sem_loop
+    loop = asyncio.get_running_loop()
+    if _decode_sem_loop is not loop:
+        _decode_sem_async = asyncio.Semaphore(DECODE_CONCURRENCY)
+        _decode_sem_loop = loop
+    return _decode_sem_async
+
+
+def _render_pil(pdf, page_index: int, dpi: int, max_size: int = None) -> Image.Image:
+    """Render one page of an open PDF document to a PIL Image, fitting it within max_size if given."""
+    page = pdf[page_index]
+    scale = dpi / 72
+    if max_size:
+        # Let pdfium render at the target size instead of rendering large and resizing afterwards
+        scale = min(scale, max_size / max(page.get_size()))
+    return page.render(scale=scale).to_pil()
+
+
+def _render_page(page_index: int, dpi: int, max_size: int = None):
+    """Render one PDF page in a worker process, returning raw pixels (PIL Images pickle poorly)."""
+    image = _render_pil(_render_pdf, page_index, dpi, max_size)
+    return image.tobytes(), image.size, image.mode
+
+
+def _is_retriable(status_code: int, body: str) -> bool:
+    """Check whether an HTTP error response is a rate limit or transient failure."""
+    if status_code in RETRY_STATUS_CODES:
+        return True
+    if status_code in NON_RETRY_STATUS_CODES:
+        return False
+    body = body.lower()
+    return 'rate limit' in body or 'quota' in body
+
+
+def _retry_delay(attempt: int, base: float, cap: float, retry_after: str = None) -> float:
+    """Compute backoff delay in seconds, honoring a numeric Retry-After header."""
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return min(cap, base * 2 ** attempt) + random.uniform(0, 0.25)
+
 
 class OCRApp:
     """OCR application using Qwen2-VL vision-language model."""
 
-    def __init__(self, api_url: str, api_key: str, model: str = "qwen2-vl-32b-instruct-awq"):
+    def __init__(self, api_url: str, api_key: str, model: str = "qwen2-vl-32b-instruct-awq",
+                 max_concurrency: int = 8, rps: float = None):
         """
         Initialize OCR app.
 
@@ -43,21 +242,36 @@ class OCRApp:
             api_url: API endpoint URL
             api_key: Bearer token for authentication
             model: Model name to use
+            max_concurrency: Maximum number of in-flight API requests for multi-page OCR
+            rps: Maximum API requests per second for async calls, None or 0 for no limit
         """
         self.api_url = api_url
         self.api_key = api_key
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(rps) if rps else None
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        }
+
+        # Shared session so connections are kept alive across requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self.headers)
+
+        # aiohttp session for the async paths, created lazily inside the event loop
+        self._client_session = None
+        self._client_loop = None
 
-    def pdf_to_images(self, pdf_path: str, dpi: int = 200) -> List[Image.Image]:
+    def _check_pdf_source(self, pdf_path: Union[str, bytes]) -> None:
         """
-        Convert PDF to list of PIL Images.
+        Ensure a PDF backend is available and the PDF file exists.
 
         Args:
-            pdf_path: Path to PDF file
-            dpi: Resolution for conversion (default: 200)
-
-        Returns:
-            List of PIL Image objects
+            pdf_path: Path to PDF file, or raw PDF bytes
         """
         if PDF_BACKEND is None:
             raise ImportError(
@@ -68,24 +282,134 @@ class OCRApp:
                 "  (pdf2image also requires poppler-utils)"
             )
 
-        path = Path(pdf_path)
-        if not path.exists():
+        if not isinstance(pdf_path, bytes) and not Path(pdf_path).exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
+    def pdf_to_images(self, pdf_path: Union[str, bytes], dpi: int = 200, num_workers: int = None,
+                      max_size: int = MAX_IMAGE_SIZE) -> List[Image.Image]:
+        """
+        Convert PDF to list of PIL Images.
+
+        Args:
+            pdf_path: Path to PDF file, or raw PDF bytes
+            dpi: Resolution for conversion (default: 200)
+            num_workers: Number of parallel render workers (default: min(CPU count, 4)),
+                used for documents with at least RENDER_POOL_MIN_PAGES pages
+            max_size: Maximum rendered width/height in pixels, None for no limit (pypdfium2 only)
+
+        Returns:
+            List of PIL Image objects
+        """
+        with _DECODE_SEM:
+            return self._pdf_to_images(pdf_path, dpi, num_workers, max_size)
+
+    def _pdf_to_images(self, pdf_path: Union[str, bytes], dpi: int, num_workers: int,
+                       max_size: int) -> List[Image.Image]:
+        """pdf_to_images without the decode limit, for callers that already hold a decode slot."""
+        self._check_pdf_source(pdf_path)
+        num_workers = num_workers or DEFAULT_RENDER_WORKERS
+
         if PDF_BACKEND == 'pypdfium2':
-            pdf = pdfium.PdfDocument(pdf_path)
-            images = []
-            for page_num in range(len(pdf)):
-                page = pdf[page_num]
-                bitmap = page.render(scale=dpi/72)
-                pil_image = bitmap.to_pil()
-                images.append(pil_image)
-            return images
+            with _PDFIUM_LOCK:
+                pdf, page_count = _open_pdf(pdf_path)
+                try:
+                    if min(num_workers, page_count) <= 1 or page_count < RENDER_POOL_MIN_PAGES:
+                        return [_render_pil(pdf, page_num, dpi, max_size) for page_num in range(page_count)]
+                finally:
+                    pdf.close()
+
+            # Rendering is CPU-bound and independent per page, fan it out to worker processes
+            with ProcessPoolExecutor(max_workers=min(num_workers, page_count),
+                                     initializer=_init_render_worker, initargs=(pdf_path,)) as executor:
+                # Workers are forked on the first submit, which must not happen
+                # while another thread is inside PDFium
+                with _PDFIUM_LOCK:
+                    pages = executor.map(_render_page, range(page_count), repeat(dpi), repeat(max_size))
+                return [Image.frombytes(mode, size, raw) for raw, size, mode in pages]
 
         elif PDF_BACKEND == 'pdf2image':
-            return convert_from_path(pdf_path, dpi=dpi)
+            if isinstance(pdf_path, bytes):
+                return convert_from_bytes(pdf_path, dpi=dpi, thread_count=num_workers)
+            return convert_from_path(pdf_path, dpi=dpi, thread_count=num_workers)
+
+    async def iter_pdf_pages(self, pdf_path: Union[str, bytes], dpi: int = 200, num_workers: int = None,
+                             max_size: int = MAX_IMAGE_SIZE) -> AsyncIterator[Tuple[int, int, Image.Image]]:
+        """
+        Render PDF pages one at a time, yielding each page as soon as it is ready.
+
+        Args:
+            pdf_path: Path to PDF file, or raw PDF bytes
+            dpi: Resolution for conversion (default: 200)
+            num_workers: Number of parallel render workers (default: min(CPU count, 4)),
+                used for documents with at least RENDER_POOL_MIN_PAGES pages
+            max_size: Maximum rendered width/height in pixels, None for no limit (pypdfium2 only)
+
+        Yields:
+            Tuples of (1-based page number, page count, PIL Image)
+        """
+        self._check_pdf_source(pdf_path)
+        num_workers = num_workers or DEFAULT_RENDER_WORKERS
+        loop = asyncio.get_running_loop()
+
+        # Renders share the decode limit with other requests, without blocking the loop
+        sem = _get_decode_semaphore()
 
-    def resize_image_if_needed(self, image: Image.Image, max_width: int = 1024, max_height: int = 1024) -> Image.Image:
+        if PDF_BACKEND != 'pypdfium2':
+            # pdf2image renders whole documents, so there is nothing to stream
+            async with sem:
+                images = await loop.run_in_executor(None, self._pdf_to_images, pdf_path, dpi, num_workers, max_size)
+            for page_num, image in enumerate(images, 1):
+                yield page_num, len(images), image
+            return
+
+        pdf, page_count = await loop.run_in_executor(_PDFIUM_EXECUTOR, _pdfium_call, _open_pdf, pdf_path)
+
+        if min(num_workers, page_count) <= 1 or page_count < RENDER_POOL_MIN_PAGES:
+            try:
+                for page_index in range(page_count):
+                    async with sem:
+                        image = await loop.run_in_executor(
+                            _PDFIUM_EXECUTOR, _pdfium_call, _render_pil, pdf, page_index, dpi, max_size
+                        )
+                    yield page_index + 1, page_count, image
+            finally:
+                await loop.run_in_executor(_PDFIUM_EXECUTOR, _pdfium_call, pdf.close)
+            return
+
+        # Keep up to num_workers pages rendering ahead of the consumer
+        await loop.run_in_executor(_PDFIUM_EXECUTOR, _pdfium_call, pdf.close)
+        executor = ProcessPoolExecutor(max_workers=min(num_workers, page_count),
+                                       initializer=_init_render_worker, initargs=(pdf_path,))
+        try:
+            pending = deque()
+            next_page = 0
+            for page_index in range(page_count):
+                while next_page < page_count and len(pending) < num_workers:
+                    await sem.acquire()
+                    try:
+                        # Submit from the PDFium thread: the first submit forks the
+                        # workers, which must not happen while PDFium is in use
+                        future = asyncio.wrap_future(await loop.run_in_executor(
+                            _PDFIUM_EXECUTOR, _pdfium_call, executor.submit, _render_page, next_page, dpi, max_size
+                        ))
+                    except BaseException:
+                        # e.g. BrokenProcessPool after a worker was killed; never leak the permit
+                        sem.release()
+                        raise
+                    future.add_done_callback(lambda _: sem.release())
+                    pending.append(future)
+                    next_page += 1
+                raw, size, mode = await pending.popleft()
+                yield page_index + 1, page_count, Image.frombytes(mode, size, raw)
+        finally:
+            # Never wait for the workers here: when iteration stops early (client
+            # disconnect, failed page) that would block the event loop until the
+            # in-flight renders finish
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def resize_image_if_needed(image: Image.Image, max_width: int = MAX_IMAGE_SIZE,
+                               max_height: int = MAX_IMAGE_SIZE) -> Image.Image:
         """
         Resize image if it exceeds maximum dimensions to reduce token usage.
 
@@ -110,6 +434,23 @@ class OCRApp:
         print(f"Resizing image from {width}x{height} to {new_width}x{new_height}")
         return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
+    @staticmethod
+    def save_jpeg(image: Image.Image, buffer: io.BytesIO, quality: int = 85) -> None:
+        """
+        Encode image as JPEG into buffer, using libjpeg-turbo when available.
+
+        Args:
+            image: PIL Image object
+            buffer: Output buffer
+            quality: JPEG quality
+        """
+        if JPEG_BACKEND == 'turbojpeg' and image.mode == 'RGB':
+            buffer.write(TURBOJPEG.encode(
+                np.asarray(image), quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420
+            ))
+        else:
+            image.save(buffer, format='JPEG', quality=quality)
+
     def image_to_base64(self, image: Image.Image, format: str = 'PNG') -> str:
         """
         Convert PIL Image to base64 data URL with auto-resize.
@@ -127,38 +468,57 @@ class OCRApp:
         buffered = io.BytesIO()
         # Use JPEG for better compression if format allows
         if format.upper() in ['PNG', 'BMP']:
-            image.save(buffered, format='JPEG', quality=85)
+            self.save_jpeg(image, buffered)
             mime_type = 'image/jpeg'
         else:
             image.save(buffered, format=format, quality=85 if format.upper() == 'JPEG' else None)
             mime_type = f'image/{format.lower()}'
 
-        img_str = base64.b64encode(buffered.getvalue()).decode('utf-8')
-        return f"data:{mime_type};base64,{img_str}"
+        return _data_url(buffered, mime_type)
 
-    def encode_image_base64(self, image_path: str) -> str:
+    def encode_image_base64(self, image_path: Union[str, bytes]) -> str:
         """
         Encode local image to base64 data URL with auto-resize for large images.
 
         Args:
-            image_path: Path to local image file
+            image_path: Path to local image file, or raw image bytes
 
         Returns:
             Base64 encoded data URL
         """
-        path = Path(image_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
+        # Bound concurrent decodes across callers to cap bitmap memory
+        with _DECODE_SEM:
+            return self._encode_image_base64(image_path)
+
+    def _encode_image_base64(self, image_path: Union[str, bytes]) -> str:
+        """encode_image_base64 without the decode limit, for callers that already hold a decode slot."""
+        if isinstance(image_path, bytes):
+            image_file = io.BytesIO(image_path)
+            image_path = 'from bytes'
+        else:
+            if not Path(image_path).exists():
+                raise FileNotFoundError(f"Image file not found: {image_path}")
+            image_file = image_path
 
         # Load image with PIL and resize if needed
         try:
-            image = Image.open(image_path)
+            image = Image.open(image_file)
+
+            # Let libjpeg DCT-scale large JPEGs while decoding (1/2, 1/4 or 1/8),
+            # keeping at least MAX_IMAGE_SIZE so the final resize still sets the size.
+            # No-op for other formats.
+            image.draft('RGB', (MAX_IMAGE_SIZE, MAX_IMAGE_SIZE))
 
             # Convert RGBA to RGB if needed
             if image.mode == 'RGBA':
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                background.paste(image, mask=image.split()[3])
-                image = background
+                alpha = image.getchannel('A')
+                if alpha.getextrema() == (255, 255):
+                    # Fully opaque, no need to composite onto a background
+                    image = image.convert('RGB')
+                else:
+                    background = Image.new('RGB', image.size, (255, 255, 255))
+                    background.paste(image, mask=alpha)
+                    image = background
             elif image.mode != 'RGB':
                 image = image.convert('RGB')
 
@@ -167,39 +527,157 @@ class OCRApp:
 
             # Convert to JPEG with good quality for smaller size
             buffered = io.BytesIO()
-            image.save(buffered, format='JPEG', quality=85)
-            img_str = base64.b64encode(buffered.getvalue()).decode('utf-8')
+            self.save_jpeg(image, buffered)
 
-            return f"data:image/jpeg;base64,{img_str}"
+            return _data_url(buffered, 'image/jpeg')
 
         except Exception as e:
             raise Exception(f"Failed to process image {image_path}: {e}")
 
-    def ocr_image(self, image_source: str, prompt: str = "OCR this image and summarize key fields.") -> Dict[str, Any]:
+    def _get_client_session(self) -> aiohttp.ClientSession:
         """
-        Perform OCR on a single image.
+        Return the shared aiohttp session for the running event loop.
+
+        The session (and its connection pool) is reused across calls, and
+        recreated if the previous one was closed or bound to another loop.
+
+        Returns:
+            aiohttp session
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_session is None or self._client_session.closed or self._client_loop is not loop:
+            self._client_session = aiohttp.ClientSession(headers=self.headers)
+            self._client_loop = loop
+        return self._client_session
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session."""
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+            self._client_loop = None
+
+    def _run(self, coro):
+        """
+        Run a coroutine in a new event loop from synchronous code.
+
+        The aiohttp session is closed before the loop goes away.
 
         Args:
-            image_source: URL or local file path to image
-            prompt: Custom prompt for OCR task
+            coro: Coroutine to run
+
+        Returns:
+            Coroutine result
+        """
+        async def run_and_close():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run_and_close())
+
+    def _post_with_retry(self, payload: Dict[str, Any], max_retries: int = 3,
+                         base: float = 1.0, cap: float = 30.0) -> requests.Response:
+        """
+        POST payload to the API, retrying rate-limited and transient failures.
+
+        Args:
+            payload: JSON request body
+            max_retries: Maximum number of retries after the first attempt
+            base: Initial backoff delay in seconds
+            cap: Maximum backoff delay in seconds
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails permanently
+        """
+        # Serialize once with orjson, much faster than stdlib json for multi-MB image payloads
+        request_body = orjson.dumps(payload)
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.session.post(self.api_url, data=request_body, timeout=300)
+                response.raise_for_status()
+                return response
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == max_retries:
+                    raise
+                error = str(e)
+                delay = _retry_delay(attempt, base, cap)
+            except requests.exceptions.HTTPError as e:
+                if attempt == max_retries or not _is_retriable(e.response.status_code, e.response.text):
+                    raise
+                error = str(e)
+                delay = _retry_delay(attempt, base, cap, e.response.headers.get('Retry-After'))
+
+            print(f"Request failed ({error}), retrying in {delay:.1f}s ({attempt + 1}/{max_retries})...")
+            time.sleep(delay)
+
+    async def _post_with_retry_async(self, session: aiohttp.ClientSession, payload: Dict[str, Any],
+                                     max_retries: int = 3, base: float = 1.0,
+                                     cap: float = 30.0) -> Dict[str, Any]:
+        """
+        Async variant of _post_with_retry using a shared aiohttp session.
+
+        Args:
+            session: Shared aiohttp session
+            payload: JSON request body
+            max_retries: Maximum number of retries after the first attempt
+            base: Initial backoff delay in seconds
+            cap: Maximum backoff delay in seconds
 
         Returns:
             API response as dictionary
+
+        Raises:
+            aiohttp.ClientError: If the request fails permanently
+            asyncio.TimeoutError: If the last attempt timed out
+            ValueError: If a successful response is not a JSON object
         """
-        # Determine if source is URL or local file
-        if image_source.startswith(('http://', 'https://')):
-            image_url = image_source
-        else:
-            # Local file - encode to base64
-            image_url = self.encode_image_base64(image_source)
+        request_body = orjson.dumps(payload)
 
-        # Prepare API request
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
+        for attempt in range(max_retries + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
 
-        payload = {
+            try:
+                async with session.post(self.api_url, data=request_body, timeout=aiohttp.ClientTimeout(total=300)) as response:
+                    if response.status < 400:
+                        # Raises ValueError for non-JSON bodies, e.g. a proxy's HTML page
+                        result = await response.json(content_type=None)
+                        if result is None:
+                            raise ValueError(f"Empty response body (status {response.status})")
+                        return result
+
+                    error_text = await response.text()
+                    if attempt == max_retries or not _is_retriable(response.status, error_text):
+                        response.raise_for_status()
+                    error = f"{response.status}, message={response.reason!r}"
+                    delay = _retry_delay(attempt, base, cap, response.headers.get('Retry-After'))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == max_retries:
+                    raise
+                error = str(e) or type(e).__name__
+                delay = _retry_delay(attempt, base, cap)
+
+            print(f"Request failed ({error}), retrying in {delay:.1f}s ({attempt + 1}/{max_retries})...")
+            await asyncio.sleep(delay)
+
+    def _build_payload(self, prompt: str, image_url: str) -> Dict[str, Any]:
+        """
+        Build chat completion request body for a single image.
+
+        Args:
+            prompt: Text prompt sent alongside the image
+            image_url: Image URL or base64 data URL
+
+        Returns:
+            JSON request body
+        """
+        return {
             "model": self.model,
             "messages": [
                 {
@@ -212,86 +690,234 @@ class OCRApp:
             ]
         }
 
+    def ocr_image(self, image_source: Union[str, bytes], prompt: str = "OCR this image and summarize key fields.") -> Dict[str, Any]:
+        """
+        Perform OCR on a single image.
+
+        Args:
+            image_source: URL, local file path or raw bytes of image
+            prompt: Custom prompt for OCR task
+
+        Returns:
+            API response as dictionary
+        """
+        # Determine if source is URL or local file/bytes
+        if isinstance(image_source, str) and image_source.startswith(('http://', 'https://')):
+            image_url = image_source
+        else:
+            # Local file or bytes - encode to base64
+            image_url = self.encode_image_base64(image_source)
+
         try:
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=300)
-            response.raise_for_status()
+            response = self._post_with_retry(self._build_payload(prompt, image_url))
             return response.json()
         except requests.exceptions.RequestException as e:
             return {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
 
-    def ocr_multiple_images(self, images: List[str], prompt: str = "OCR this image and extract all text.") -> List[Dict[str, Any]]:
+    async def ocr_image_async(self, image_source: Union[str, bytes], prompt: str = "OCR this image and summarize key fields.") -> Dict[str, Any]:
         """
-        Perform OCR on multiple images.
+        Async variant of ocr_image for use inside a running event loop.
 
         Args:
-            images: List of image URLs or PIL Image objects
+            image_source: URL, local file path or raw bytes of image
             prompt: Custom prompt for OCR task
 
         Returns:
-            List of API responses
+            API response as dictionary
         """
-        results = []
-        for idx, img in enumerate(images, 1):
-            print(f"Processing image {idx}/{len(images)}...")
+        if isinstance(image_source, str) and image_source.startswith(('http://', 'https://')):
+            image_url = image_source
+        else:
+            loop = asyncio.get_running_loop()
+            async with _get_decode_semaphore():
+                image_url = await loop.run_in_executor(None, self._encode_image_base64, image_source)
+
+        session = self._get_client_session()
+        try:
+            return await self._post_with_retry_async(session, self._build_payload(prompt, image_url))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return {"error": str(e) or type(e).__name__, "status_code": getattr(e, 'status', None)}
+
+    async def _ocr_one(self, session: aiohttp.ClientSession, idx: int, img: Any, total: int,
+                       sem: asyncio.Semaphore, prompt: str) -> Dict[str, Any]:
+        """
+        Perform OCR on a single page as part of a multi-page batch.
 
-            if isinstance(img, Image.Image):
-                # Convert PIL Image to base64
-                image_url = self.image_to_base64(img)
+        Args:
+            session: Shared aiohttp session
+            idx: 1-based page index
+            img: Image URL, local path, raw bytes or PIL Image object
+            total: Total number of pages in the batch
+            sem: Semaphore bounding in-flight API requests
+            prompt: Custom prompt for OCR task
+
+        Returns:
+            Page result with API response
+        """
+        loop = asyncio.get_running_loop()
+
+        if isinstance(img, Image.Image):
+            # Convert PIL Image to base64 (CPU-bound, keep it off the event loop).
+            # Large pages go to worker processes so encoding runs outside this GIL.
+            if ENCODE_WORKERS > 1 and len(img.getbands()) * img.width * img.height >= ENCODE_POOL_MIN_BYTES:
+                pool = _get_encode_pool()
+                try:
+                    image_url = await loop.run_in_executor(
+                        pool, _encode_page, img.tobytes(), img.width, img.height, img.mode
+                    )
+                except BrokenProcessPool:
+                    # A worker died (e.g. OOM-killed): replace the pool for later pages
+                    # and encode this one in a thread
+                    _discard_encode_pool(pool)
+                    image_url = await loop.run_in_executor(None, self.image_to_base64, img)
             else:
-                # String path or URL
-                if img.startswith(('http://', 'https://')):
-                    image_url = img
-                else:
-                    image_url = self.encode_image_base64(img)
-
-            # Prepare API request
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-
-            page_prompt = f"{prompt} (Page {idx}/{len(images)})"
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": page_prompt},
-                            {"type": "image_url", "image_url": {"url": image_url}}
-                        ]
-                    }
-                ]
-            }
+                image_url = await loop.run_in_executor(None, self.image_to_base64, img)
+        else:
+            # String path, URL or raw bytes
+            if isinstance(img, str) and img.startswith(('http://', 'https://')):
+                image_url = img
+            else:
+                async with _get_decode_semaphore():
+                    image_url = await loop.run_in_executor(None, self._encode_image_base64, img)
+
+        payload = self._build_payload(f"{prompt} (Page {idx}/{total})", image_url)
 
+        async with sem:
+            print(f"Processing image {idx}/{total}...")
             try:
-                response = requests.post(self.api_url, headers=headers, json=payload, timeout=300)
-                response.raise_for_status()
-                results.append({"page": idx, "response": response.json()})
-            except requests.exceptions.RequestException as e:
-                results.append({
+                return {"page": idx, "response": await self._post_with_retry_async(session, payload)}
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                return {
                     "page": idx,
-                    "response": {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
-                })
+                    "response": {"error": str(e) or type(e).__name__, "status_code": getattr(e, 'status', None)}
+                }
+
+    async def _gather(self, images: List[Any], prompt: str) -> List[Dict[str, Any]]:
+        """
+        Run OCR on all images concurrently, bounded by max_concurrency.
+
+        Args:
+            images: List of image URLs, local paths or PIL Image objects
+            prompt: Custom prompt for OCR task
+
+        Returns:
+            List of API responses in page order
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        total = len(images)
+
+        session = self._get_client_session()
+        return await asyncio.gather(*(
+            self._ocr_one(session, idx, img, total, sem, prompt)
+            for idx, img in enumerate(images, 1)
+        ))
+
+    def ocr_multiple_images(self, images: List[str], prompt: str = "OCR this image and extract all text.") -> List[Dict[str, Any]]:
+        """
+        Perform OCR on multiple images concurrently.
+
+        Args:
+            images: List of image URLs or PIL Image objects
+            prompt: Custom prompt for OCR task
 
-        return results
+        Returns:
+            List of API responses
+        """
+        return list(self._run(self._gather(images, prompt)))
 
-    def process_pdf(self, pdf_path: str, prompt: str = "OCR this image and extract all text.", dpi: int = 200) -> List[Dict[str, Any]]:
+    def process_pdf(self, pdf_path: Union[str, bytes], prompt: str = "OCR this image and extract all text.", dpi: int = 200) -> List[Dict[str, Any]]:
         """
         Process a PDF file and perform OCR on all pages.
 
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, or raw PDF bytes
             prompt: Custom prompt for OCR task
             dpi: Resolution for PDF conversion
 
         Returns:
             List of API responses for each page
         """
+        return self._run(self.process_pdf_async(pdf_path, prompt, dpi))
+
+    async def process_pdf_async(self, pdf_path: Union[str, bytes], prompt: str = "OCR this image and extract all text.", dpi: int = 200) -> List[Dict[str, Any]]:
+        """
+        Async variant of process_pdf for use inside a running event loop.
+
+        Args:
+            pdf_path: Path to PDF file, or raw PDF bytes
+            prompt: Custom prompt for OCR task
+            dpi: Resolution for PDF conversion
+
+        Returns:
+            List of API responses for each page
+        """
+        results = [result async for result in self.iter_pdf_results(pdf_path, prompt, dpi)]
+
+        print(f"Processed {len(results)} page(s)")
+        return sorted(results, key=lambda result: result['page'])
+
+    async def iter_pdf_results(self, pdf_path: Union[str, bytes], prompt: str = "OCR this image and extract all text.",
+                               dpi: int = 200) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run OCR on each PDF page and yield page results as soon as they complete.
+
+        Results arrive in completion order, not page order.
+
+        Args:
+            pdf_path: Path to PDF file, or raw PDF bytes
+            prompt: Custom prompt for OCR task
+            dpi: Resolution for PDF conversion
+
+        Yields:
+            Page result with API response
+        """
         print(f"Converting PDF to images (DPI: {dpi})...")
-        images = self.pdf_to_images(pdf_path, dpi=dpi)
-        print(f"Found {len(images)} page(s)")
-        return self.ocr_multiple_images(images, prompt)
+
+        # Pages flow through a small queue so rendering overlaps with the API calls
+        # and only a bounded number of rendered pages is held in memory
+        queue = asyncio.Queue(maxsize=4)
+        sem = asyncio.Semaphore(self.max_concurrency)
+        done = asyncio.Queue()
+
+        async def produce():
+            async for page_num, page_count, image in self.iter_pdf_pages(pdf_path, dpi):
+                await queue.put((page_num, page_count, image))
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+
+        async def consume(session):
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                page_num, page_count, image = item
+                await done.put(await self._ocr_one(session, page_num, image, page_count, sem, prompt))
+
+        session = self._get_client_session()
+        tasks = [asyncio.ensure_future(produce())]
+        tasks += [asyncio.ensure_future(consume(session)) for _ in range(self.max_concurrency)]
+        def finished(future):
+            # Mark the outcome as retrieved so an early exit does not log a
+            # spurious warning; failures are re-raised by awaiting the runner
+            if not future.cancelled():
+                future.exception()
+            # Wake the loop below once every task has finished, successfully or not
+            done.put_nowait(None)
+
+        runner = asyncio.gather(*tasks)
+        runner.add_done_callback(finished)
+        try:
+            while True:
+                result = await done.get()
+                if result is None:
+                    break
+                yield result
+            # Re-raise any rendering failure
+            await runner
+        finally:
+            # Stop outstanding work on failure, or when the caller stops iterating early
+            for task in tasks:
+                task.cancel()
 
     def extract_text(self, api_response: Dict[str, Any]) -> str:
         """
@@ -344,6 +970,8 @@ Examples:
     default_api_key = os.getenv('API_KEY', '')
     default_model = os.getenv('MODEL', 'qwen2-vl-32b-instruct-awq')
     default_dpi = int(os.getenv('DEFAULT_DPI', '200'))
+    default_max_concurrency = int(os.getenv('MAX_CONCURRENCY', '8'))
+    default_rps = float(os.getenv('OCR_RPS', '4'))
 
     parser.add_argument('files', nargs='+', help='Image URLs, image files, or PDF files (can specify multiple)')
     parser.add_argument('--prompt', '-p',
@@ -368,11 +996,19 @@ Examples:
                        help=f'DPI for PDF conversion (default: {default_dpi})')
     parser.add_argument('--separate-pages', action='store_true',
                        help='Show results separated by page')
+    parser.add_argument('--max-concurrency',
+                       type=int,
+                       default=default_max_concurrency,
+                       help=f'Maximum concurrent API requests for multi-page documents (default: {default_max_concurrency})')
+    parser.add_argument('--rps',
+                       type=float,
+                       default=default_rps,
+                       help=f'Maximum API requests per second for multi-page documents, 0 for no limit (default: {default_rps:g})')
 
     args = parser.parse_args()
 
     # Initialize OCR app
-    app = OCRApp(args.api_url, args.api_key, args.model)
+    app = OCRApp(args.api_url, args.api_key, args.model, max_concurrency=args.max_concurrency, rps=args.rps)
 
     print(f"Processing {len(args.files)} file(s)")
     print(f"Using model: {args.model}")